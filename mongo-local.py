@@ -10,10 +10,8 @@ from push_data import DataExtractionAndPusher
 MONGO_URI = "mongodb://localhost:27017/"
 
 if __name__ == "__main__":
+    logger.configure_logging()
     try:
-        # Initialisation de l'extracteur de données
-        data_pusher = DataExtractionAndPusher(database="ai", collection="NetworkData", mongo_uri=MONGO_URI)
-
         # Vérification de l'existence du fichier CSV
         csv_path = "Network_Data/phisingData.csv"
         if not os.path.exists(csv_path):
@@ -21,15 +19,15 @@ if __name__ == "__main__":
 
         logger.logging.info(f"Chargement du fichier: {csv_path}")
 
-        # Conversion du CSV en JSON
-        records = data_pusher.csv_to_json_converter(csv_path)
-        df = pd.DataFrame(records)
+        # Lecture directe du CSV, sans passer par une liste de dictionnaires JSON
+        df = pd.read_csv(csv_path, engine="pyarrow")
 
-        # Insertion des données dans MongoDB
-        data_pusher.insert_dataframe(df)
+        # Initialisation de l'extracteur de données et insertion dans MongoDB
+        with DataExtractionAndPusher(database="ai", collection="NetworkData", mongo_uri=MONGO_URI) as data_pusher:
+            data_pusher.insert_dataframe(df)
 
-        logger.logging.info(f"{len(records)} enregistrements insérés avec succès dans MongoDB.")
-        print(f"✅ {len(records)} enregistrements insérés avec succès.")
+        logger.logging.info(f"{len(df)} enregistrements insérés avec succès dans MongoDB.")
+        print(f"✅ {len(df)} enregistrements insérés avec succès.")
 
     except NetworkSecurityException as nse:
         logger.logging.info(f"Erreur de sécurité réseau: {nse}")
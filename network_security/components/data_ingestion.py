@@ -1,5 +1,7 @@
 import os
 import sys
+import atexit
+import threading
 import pymongo
 import pandas as pd
 import numpy as np
@@ -7,16 +9,46 @@ from typing import List, Tuple
 from sklearn.model_selection import train_test_split
 from dotenv import load_dotenv
 
+from network_security.constants.training_pipeline import TARGET_COLUMN, DATA_INGESTION_MONGO_COMPRESSORS
 from network_security.exceptions.exception import NetworkSecurityException
 from network_security.logging import logger
 from network_security.entity.config_entity import DataIngestionConfig
 from network_security.entity.artifact_entity import DataIngestArtifact
+from network_security.utils.main_utils.utils import load_schema
 
 # Chargement des variables d'environnement
 load_dotenv()
 
 MONGO_URI = os.getenv("MONGO_DB_URL")
 
+# Client MongoDB partagé par le processus (pool de connexions réutilisé entre les appels)
+_MONGO_CLIENT = None
+_MONGO_CLIENT_LOCK = threading.Lock()
+
+
+def _get_mongo_client() -> pymongo.MongoClient:
+    """
+    Retourne le client MongoDB du processus, créé au premier appel.
+
+    La résolution SRV/DNS, la poignée de main TLS et l'authentification ne sont
+    ainsi payées qu'une seule fois ; la compression du protocole réduit le volume
+    de BSON transféré (zstd et snappy sont fournis par les extras `pymongo[zstd,snappy]`
+    de requirements.txt ; sans eux, PyMongo émet un avertissement et se rabat sur zlib).
+
+    :return: Instance partagée de pymongo.MongoClient.
+    """
+    global _MONGO_CLIENT
+    if _MONGO_CLIENT is None:
+        with _MONGO_CLIENT_LOCK:
+            if _MONGO_CLIENT is None:
+                _MONGO_CLIENT = pymongo.MongoClient(
+                    MONGO_URI,
+                    maxPoolSize=50,
+                    compressors=DATA_INGESTION_MONGO_COMPRESSORS,
+                )
+                atexit.register(_MONGO_CLIENT.close)
+    return _MONGO_CLIENT
+
 
 class DataIngestion:
     """
@@ -30,8 +62,12 @@ class DataIngestion:
 
         :param data_ingestion_config: Instance de DataIngestionConfig contenant les chemins de stockage.
         """
-        self.data_ingestion_config = data_ingestion_config
-        self.mongo_client = None
+        try:
+            self.data_ingestion_config = data_ingestion_config
+            self.mongo_client = None
+            self._schema_config = load_schema()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
 
     def export_collection_as_dataframe(self)->pd.DataFrame :
         """
@@ -43,19 +79,30 @@ class DataIngestion:
             database_name = self.data_ingestion_config.database_name
             collection_name = self.data_ingestion_config.collection_name
 
-            self.mongo_client = pymongo.MongoClient(MONGO_URI)
+            self.mongo_client = _get_mongo_client()
             collection = self.mongo_client[database_name][collection_name]
 
-            data = list(collection.find({}))
-            if not data:
+            # "_id" est exclu et les colonnes numériques converties en double côté serveur :
+            # les valeurs non convertibles ('na') deviennent null, donc NaN dans le DataFrame
+            numerical_columns = self._schema_config["numerical_columns"]
+            pipeline = [{
+                "$project": {
+                    "_id": 0,
+                    **{
+                        column: {"$convert": {"input": f"${column}", "to": "double", "onError": None}}
+                        for column in numerical_columns
+                    },
+                }
+            }]
+            cursor = collection.aggregate(
+                pipeline,
+                batchSize=self.data_ingestion_config.mongo_batch_size,
+                allowDiskUse=True,
+            )
+            df = pd.DataFrame.from_records(cursor, columns=numerical_columns)
+            if df.empty:
                 raise ValueError("La collection est vide ou inaccessible.")
 
-            df = pd.DataFrame(data)
-            if "_id" in df.columns:
-                df.drop(columns=["_id"], inplace=True)
-
-            df.replace('na', np.nan, inplace=True)
-
             logger.logging.info(f"✅ Données extraites de {database_name}.{collection_name}, shape: {df.shape}")
 
             return df
@@ -66,7 +113,7 @@ class DataIngestion:
 
     def export_data_to_feature_store(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """
-        Sauvegarde le DataFrame dans un fichier CSV en tant que Feature Store.
+        Sauvegarde le DataFrame dans un fichier Parquet (compression zstd) en tant que Feature Store.
 
         :param dataframe: DataFrame contenant les données à stocker.
         :return: DataFrame enregistré.
@@ -75,7 +122,7 @@ class DataIngestion:
             feature_store_file_path = self.data_ingestion_config.feature_store_file_path
 
             os.makedirs(os.path.dirname(feature_store_file_path), exist_ok=True)
-            dataframe.to_csv(feature_store_file_path, index=False, header=True)
+            dataframe.to_parquet(feature_store_file_path, engine="pyarrow", compression="zstd", index=False)
 
             logger.logging.info(f"✅ Données sauvegardées dans le Feature Store: {feature_store_file_path}")
 
@@ -92,11 +139,15 @@ class DataIngestion:
         :return: Tuple (train_set, test_set)
         """
         try:
-            train_set, test_set = train_test_split(
-                dataframe,
+            # Split sur les indices, stratifié sur la cible pour conserver l'équilibre des classes
+            train_idx, test_idx = train_test_split(
+                np.arange(len(dataframe)),
                 test_size=self.data_ingestion_config.train_test_split_ratio,
+                stratify=dataframe[TARGET_COLUMN].to_numpy(),
                 random_state=42  # Fixer la seed pour la reproductibilité
             )
+            train_set = dataframe.iloc[train_idx]
+            test_set = dataframe.iloc[test_idx]
 
             logger.logging.info(f"📊 Taille du Train Set: {len(train_set)}, Test Set: {len(test_set)}")
 
@@ -124,10 +175,12 @@ class DataIngestion:
 
             dataframe = self.export_collection_as_dataframe()
             dataframe = self.export_data_to_feature_store(dataframe)
-            self.split_data_as_train_test(dataframe)
+            train_set, test_set = self.split_data_as_train_test(dataframe)
 
             data_ingestion_artifact = DataIngestArtifact(trained_file_path=self.data_ingestion_config.training_file_path,
-                                                         test_file_path=self.data_ingestion_config.test_file_path)
+                                                         test_file_path=self.data_ingestion_config.test_file_path,
+                                                         train_df=train_set,
+                                                         test_df=test_set)
 
 
             logger.logging.info("🎯 Ingestion des données terminée avec succès.")
@@ -3,7 +3,7 @@ import sys
 import pandas as pd
 import numpy as np
 from typing import List, Tuple
-from sklearn.impute import KNNImputer
+from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
 
 from network_security.constants.training_pipeline import TARGET_COLUMN, DATA_TRANSFORMATION_IMPUTER_PARAMS
@@ -49,14 +49,14 @@ class DataTransformation:
             NetworkSecurityException: En cas d'échec de lecture du fichier.
         """
         try:
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, engine="pyarrow")
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
     @staticmethod
     def get_data_transformer_object() -> Pipeline:
         """
-        Initialise un Pipeline de transformation des données basé sur un KNNImputer.
+        Initialise un Pipeline de transformation des données basé sur un SimpleImputer (médiane).
 
         Returns:
             Pipeline: Pipeline de transformation des données.
@@ -66,12 +66,30 @@ class DataTransformation:
         """
         logging.info("Initialisation du pipeline de transformation des données...")
         try:
-            imputer = KNNImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
-            logging.info(f"KNNImputer initialisé avec {DATA_TRANSFORMATION_IMPUTER_PARAMS}")
+            imputer = SimpleImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
+            logging.info(f"SimpleImputer initialisé avec {DATA_TRANSFORMATION_IMPUTER_PARAMS}")
             return Pipeline([("imputer", imputer)])
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
+    @staticmethod
+    def build_transformed_array(features: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        Assemble les features transformées et la cible dans un tableau float32 pré-alloué.
+
+        Args:
+            features (np.ndarray): Features transformées, de forme (n, d).
+            target (np.ndarray): Cible, de forme (n,).
+
+        Returns:
+            np.ndarray: Tableau C-contigu float32 de forme (n, d + 1), la cible en dernière colonne.
+        """
+        n_rows, n_features = features.shape
+        array = np.empty((n_rows, n_features + 1), dtype=np.float32)
+        array[:, :n_features] = features
+        array[:, n_features] = target
+        return array
+
     def initiate_data_transformation(self) -> DataTransformationArtifact:
         """
         Exécute la transformation des données et enregistre les résultats.
@@ -86,8 +104,12 @@ class DataTransformation:
 
         try:
             # Chargement des données validées
-            train_df = self.read_data(self.data_validation_artifact.valid_train_file_path)
-            test_df = self.read_data(self.data_validation_artifact.valid_test_file_path)
+            train_df = self.data_validation_artifact.train_df
+            if train_df is None:
+                train_df = self.read_data(self.data_validation_artifact.valid_train_file_path)
+            test_df = self.data_validation_artifact.test_df
+            if test_df is None:
+                test_df = self.read_data(self.data_validation_artifact.valid_test_file_path)
 
             # Vérification que la colonne cible existe
             if TARGET_COLUMN not in train_df.columns or TARGET_COLUMN not in test_df.columns:
@@ -96,26 +118,30 @@ class DataTransformation:
                 )
 
             # Séparation des features et de la cible
-            input_feature_train_df = train_df.drop(columns=[TARGET_COLUMN])
-            target_feature_train_df = train_df[TARGET_COLUMN].replace(-1, 0)
+            # Features en ndarray float32 C-contigu : sklearn évite ses copies de validation d'entrée
+            input_feature_train = np.ascontiguousarray(train_df.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float32))
+            # Cible binaire : 1 reste 1, -1 devient 0
+            train_target = (train_df[TARGET_COLUMN].to_numpy() == 1).astype(np.uint8)
 
-            input_feature_test_df = test_df.drop(columns=[TARGET_COLUMN])
-            target_feature_test_df = test_df[TARGET_COLUMN].replace(-1, 0)
+            input_feature_test = np.ascontiguousarray(test_df.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float32))
+            test_target = (test_df[TARGET_COLUMN].to_numpy() == 1).astype(np.uint8)
 
             # Transformation des données
             preprocessor = self.get_data_transformer_object()
-            preprocessor.fit(input_feature_train_df)
+            preprocessor.fit(input_feature_train)
 
-            transformed_input_train_feature = preprocessor.transform(input_feature_train_df)
-            transformed_input_test_feature = preprocessor.transform(input_feature_test_df)
+            transformed_input_train_feature = preprocessor.transform(input_feature_train)
+            transformed_input_test_feature = preprocessor.transform(input_feature_test)
 
-            # Création des tableaux combinés (features + target)
-            train_arr = np.c_[transformed_input_train_feature, target_feature_train_df.to_numpy()]
-            test_arr = np.c_[transformed_input_test_feature, target_feature_test_df.to_numpy()]
+            # Création des tableaux combinés (features + target) en float32
+            train_arr = self.build_transformed_array(transformed_input_train_feature, train_target)
+            test_arr = self.build_transformed_array(transformed_input_test_feature, test_target)
 
-            # Sauvegarde des données transformées
+            # Sauvegarde des données transformées et de la cible (uint8) à part
             save_numpy_array_data(self.data_transformation_config.transformed_train_file_path, train_arr)
             save_numpy_array_data(self.data_transformation_config.transformed_test_file_path, test_arr)
+            save_numpy_array_data(self.data_transformation_config.transformed_train_target_file_path, train_target)
+            save_numpy_array_data(self.data_transformation_config.transformed_test_target_file_path, test_target)
 
             # Sauvegarde du préprocesseur
             save_object(self.data_transformation_config.transformed_object_file_path, preprocessor)
@@ -127,7 +153,9 @@ class DataTransformation:
             return DataTransformationArtifact(
                 transformed_object_file_path=self.data_transformation_config.transformed_object_file_path,
                 transformed_train_file_path=self.data_transformation_config.transformed_train_file_path,
-                transformed_test_file_path=self.data_transformation_config.transformed_test_file_path
+                transformed_test_file_path=self.data_transformation_config.transformed_test_file_path,
+                transformed_train_target_file_path=self.data_transformation_config.transformed_train_target_file_path,
+                transformed_test_target_file_path=self.data_transformation_config.transformed_test_target_file_path,
             )
 
         except Exception as e:
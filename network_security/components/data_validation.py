@@ -3,10 +3,54 @@ from network_security.entity.config_entity import DataValidationConfig
 from network_security.exceptions.exception import NetworkSecurityException
 from network_security.logging.logger import logging
 from network_security.entity.artifact_entity import DataValidationArtifact
-from scipy.stats import ks_2samp
-import os, sys, pandas as pd
-from network_security.constants.training_pipeline import SCHEMA_FILE_PATH
-from network_security.utils.main_utils.utils import write_yaml_file, read_yaml
+from scipy.special import kolmogorov
+from joblib import Parallel, delayed
+from concurrent.futures import ThreadPoolExecutor
+import os, sys, numpy as np, pandas as pd
+from network_security.utils.main_utils.utils import write_json_file, load_schema
+
+
+def _ks_2samp_pvalue(base: np.ndarray, current: np.ndarray) -> float:
+    """
+    Test de Kolmogorov-Smirnov à deux échantillons, en un seul passage numpy.
+
+    La statistique D est l'écart maximal entre les deux fonctions de répartition
+    empiriques ; la p-value utilise la distribution asymptotique de Kolmogorov.
+
+    Args:
+        base (np.ndarray) : Valeurs de référence, sans NaN.
+        current (np.ndarray) : Valeurs actuelles, sans NaN.
+
+    Returns:
+        float : p-value du test bilatéral.
+    """
+    base = np.sort(base)
+    current = np.sort(current)
+    data = np.concatenate([base, current])
+    cdf_base = np.searchsorted(base, data, side="right") / base.size
+    cdf_current = np.searchsorted(current, data, side="right") / current.size
+    statistic = np.max(np.abs(cdf_base - cdf_current))
+    effective_size = base.size * current.size / (base.size + current.size)
+    return float(kolmogorov(np.sqrt(effective_size) * statistic))
+
+
+def _ks_one(column: str, base: np.ndarray, current: np.ndarray):
+    """
+    Calcule la p-value du test de Kolmogorov-Smirnov pour une colonne.
+
+    Args:
+        column (str) : Nom de la colonne testée.
+        base (np.ndarray) : Valeurs de référence.
+        current (np.ndarray) : Valeurs actuelles.
+
+    Returns:
+        tuple : (column, p_value), p_value valant None si l'un des ensembles est vide.
+    """
+    base = base[~np.isnan(base)]
+    current = current[~np.isnan(current)]
+    if base.size == 0 or current.size == 0:
+        return column, None
+    return column, _ks_2samp_pvalue(base, current)
 
 
 class DataValidation:
@@ -37,7 +81,8 @@ class DataValidation:
         try:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
-            self._schema_config = read_yaml(SCHEMA_FILE_PATH)
+            self._schema_config = load_schema()
+            self._expected_columns = len(self._schema_config["columns"])
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -56,7 +101,7 @@ class DataValidation:
             NetworkSecurityException : En cas d'erreur de lecture du fichier.
         """
         try:
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, engine="pyarrow")
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -74,7 +119,7 @@ class DataValidation:
             NetworkSecurityException : En cas d'erreur de validation.
         """
         try:
-            expected_columns = len(self._schema_config["columns"])
+            expected_columns = self._expected_columns
             actual_columns = len(dataframe.columns)
             logging.info(f"Nombre de colonnes requis : {expected_columns}")
             logging.info(f"Nombre de colonnes dans le fichier : {actual_columns}")
@@ -101,19 +146,25 @@ class DataValidation:
             status = True
             report = {}
 
-            for column in base_df.columns:
-                d1 = base_df[column].dropna()
-                d2 = current_df[column].dropna()
+            # Les colonnes sont indépendantes : le test KS est réparti sur tous les cœurs
+            results = Parallel(n_jobs=-1, prefer="threads")(
+                delayed(_ks_one)(
+                    column,
+                    base_df[column].to_numpy(dtype=np.float64),
+                    current_df[column].to_numpy(dtype=np.float64),
+                )
+                for column in base_df.columns
+            )
 
-                if d1.empty or d2.empty:
+            for column, p_value in results:
+                if p_value is None:
                     logging.warning(f"Colonne {column} vide dans l'un des ensembles. Ignorée.")
                     continue
 
-                ks_test = ks_2samp(d1, d2)
-                drift_detected = ks_test.pvalue < threshold
+                drift_detected = p_value < threshold
 
                 report[column] = {
-                    "p_value": float(ks_test.pvalue),
+                    "p_value": p_value,
                     "drift_detected": drift_detected
                 }
 
@@ -121,8 +172,7 @@ class DataValidation:
                     status = False
 
             drift_report_file_path = self.data_validation_config.drift_report_file_path
-            os.makedirs(os.path.dirname(drift_report_file_path), exist_ok=True)
-            write_yaml_file(file_path=drift_report_file_path, content=report)
+            write_json_file(file_path=drift_report_file_path, content=report)
 
             return status
         except Exception as e:
@@ -147,17 +197,25 @@ class DataValidation:
             train_file_path = self.data_ingestion_artifact.trained_file_path
             test_file_path = self.data_ingestion_artifact.test_file_path
 
-            train_df = self.read_data(train_file_path)
-            test_df = self.read_data(test_file_path)
-
-            # Validation du nombre de colonnes
-            if not self.validate_number_of_columns(train_df):
-                logging.info("Le fichier d'entraînement n'a pas le bon nombre de colonnes.", sys)
-            if not self.validate_number_of_columns(test_df):
-              logging.info("Le fichier de test n'a pas le bon nombre de colonnes.", sys)
-
-            # Détection de la dérive des données
-            validation_status = self.detect_dataset_drift(base_df=train_df, current_df=test_df)
+            # Réutilisation des DataFrames transmis par l'ingestion, sinon lecture depuis le disque
+            train_df = self.data_ingestion_artifact.train_df
+            if train_df is None:
+                train_df = self.read_data(train_file_path)
+            test_df = self.data_ingestion_artifact.test_df
+            if test_df is None:
+                test_df = self.read_data(test_file_path)
+
+            # Validation du nombre de colonnes et détection de la dérive, exécutées en parallèle
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                train_columns_future = executor.submit(self.validate_number_of_columns, train_df)
+                test_columns_future = executor.submit(self.validate_number_of_columns, test_df)
+                drift_future = executor.submit(self.detect_dataset_drift, base_df=train_df, current_df=test_df)
+
+                if not train_columns_future.result():
+                    logging.info("Le fichier d'entraînement n'a pas le bon nombre de colonnes.")
+                if not test_columns_future.result():
+                    logging.info("Le fichier de test n'a pas le bon nombre de colonnes.")
+                validation_status = drift_future.result()
 
             # Création des répertoires pour stocker les fichiers validés
             os.makedirs(os.path.dirname(self.data_validation_config.valid_train_file_path), exist_ok=True)
@@ -173,6 +231,8 @@ class DataValidation:
                 invalid_train_file_path=None,
                 invalid_test_file_path=None,
                 drift_report_file_path=self.data_validation_config.drift_report_file_path,
+                train_df=train_df,
+                test_df=test_df,
             )
 
         except Exception as e:
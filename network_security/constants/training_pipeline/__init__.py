@@ -10,7 +10,7 @@ definition des  constantes pour le training pipeline
 TARGET_COLUMN = "Result"
 PIPELINE_NAME: str = "NetworkSecurity"
 ARTIFACT_DIR: str = "Artifacts"
-FILE_NAME: str = "phisingData.csv"
+FILE_NAME: str = "phisingData.parquet"
 
 TRAIN_FILE_NAME: str = "train.csv"
 TEST_FILE_NAME: str = "test.csv"
@@ -29,6 +29,10 @@ DATA_INGESTION_DIR_NAME:str = 'data_ingestion'
 DATA_INGESTION_FEATURE_STORE_DIR:str = 'feature_store'
 DATA_INGESTED_DIR_NAME:str = 'data_ingested'
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO:float = 0.25
+DATA_INGESTION_MONGO_BATCH_SIZE:int = 10000
+# Compresseurs du protocole MongoDB, par ordre de préférence ; zstd et snappy sont
+# fournis par les extras pymongo[zstd,snappy] de requirements.txt
+DATA_INGESTION_MONGO_COMPRESSORS:str = 'zstd,snappy,zlib'
 
 
 """
@@ -38,7 +42,7 @@ DATA_VALIDATION_DIR_NAME: str = "data_validation"
 DATA_VALIDATION_VALID_DIR: str = "validated"
 DATA_VALIDATION_INVALID_DIR: str = "invalid"
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
-DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.json"
 PREPROCESSING_OBJECT_FILE_NAME = "preprocessing.pkl"
 
 """
@@ -49,16 +53,18 @@ DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR: str = "transformed"
 DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR: str = "transformed_object"
 
 
-## kkn imputer to replace nan values
+## simple imputer (mediane) to replace nan values
 DATA_TRANSFORMATION_IMPUTER_PARAMS: dict = {
     "missing_values": np.nan,
-    "n_neighbors": 3,
-    "weights": "uniform",
+    "strategy": "median",
 }
 DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npy"
 
 DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npy"
 
+DATA_TRANSFORMATION_TRAIN_TARGET_FILE_NAME: str = "train_target.npy"
+DATA_TRANSFORMATION_TEST_TARGET_FILE_NAME: str = "test_target.npy"
+
 
 """
 Model Trainer ralated constant start with MODE TRAINER VAR NAME
@@ -1,9 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+# pandas ne sert qu'aux annotations : importer les artefacts ne le charge pas
+if TYPE_CHECKING:
+    import pandas as pd
 
 @dataclass
 class DataIngestArtifact:
     trained_file_path: str
     test_file_path: str
+    # Jeux déjà chargés en mémoire, transmis à l'étape suivante pour éviter une relecture du CSV
+    train_df: Optional["pd.DataFrame"] = field(default=None, repr=False, compare=False)
+    test_df: Optional["pd.DataFrame"] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -14,6 +22,8 @@ class DataValidationArtifact:
     invalid_test_file_path: str
     drift_report_file_path: str
     validation_status : bool
+    train_df: Optional["pd.DataFrame"] = field(default=None, repr=False, compare=False)
+    test_df: Optional["pd.DataFrame"] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -21,6 +31,8 @@ class DataTransformationArtifact:
     transformed_object_file_path: str
     transformed_train_file_path: str
     transformed_test_file_path: str
+    transformed_train_target_file_path: str
+    transformed_test_target_file_path: str
 
 
 @dataclass
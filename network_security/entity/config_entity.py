@@ -1,69 +1,92 @@
+from dataclasses import dataclass, field
 from datetime import datetime
-import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
 from network_security.constants import training_pipeline
 
+
+@dataclass(slots=True, frozen=True)
 class TrainingPipelineConfig:
     """
     Configuration du pipeline d'entraînement.
 
     Cette classe définit les chemins et noms utilisés pour stocker les artefacts
     et suivre l'évolution du pipeline.
-    """
 
-    def __init__(self, timestamp: str = None):
-        """
-        Initialise la configuration du pipeline.
+    Attributs:
+        timestamp (str): (optionnel) Timestamp unique pour identifier l'exécution.
+        pipeline_name (str): Nom du pipeline.
+        artifact_name (str): Nom du répertoire racine des artefacts.
+        artifact_dir (Path): Répertoire des artefacts de l'exécution.
+    """
 
-        :param timestamp: (optionnel) Timestamp unique pour identifier l'exécution.
-        """
-        self.timestamp = timestamp if timestamp else datetime.now().strftime("%d%m%Y%H%M%S")
-        self.pipeline_name = training_pipeline.PIPELINE_NAME
-        self.artifact_name = training_pipeline.ARTIFACT_DIR
-        self.artifact_dir = os.path.join(self.artifact_name, self.timestamp)
+    timestamp: Optional[str] = None
+    pipeline_name: str = field(init=False)
+    artifact_name: str = field(init=False)
+    artifact_dir: Path = field(init=False)
 
+    def __post_init__(self):
+        # Instance figée : les champs dérivés sont posés via object.__setattr__
+        if not self.timestamp:
+            object.__setattr__(self, "timestamp", datetime.now().strftime("%d%m%Y%H%M%S"))
+        object.__setattr__(self, "pipeline_name", training_pipeline.PIPELINE_NAME)
+        object.__setattr__(self, "artifact_name", training_pipeline.ARTIFACT_DIR)
+        object.__setattr__(self, "artifact_dir", Path(self.artifact_name) / self.timestamp)
 
-class DataIngestionConfig:
-    """
-    Configuration du module d'ingestion des données.
 
-    Cette classe définit les chemins des fichiers utilisés lors de la récupération
-    et du stockage des données pour l'entraînement et les tests.
+@lru_cache(maxsize=1)
+def get_pipeline_config() -> TrainingPipelineConfig:
     """
+    Retourne la configuration du pipeline de l'exécution courante.
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        """
-        Initialise la configuration d'ingestion des données.
+    Le timestamp est fixé au premier appel : tous les composants qui passent par
+    cette fonction écrivent donc dans le même répertoire d'artefacts.
 
-        :param training_pipeline_config: Instance de TrainingPipelineConfig.
-        """
-        self.data_ingestion_dir = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.DATA_INGESTION_DIR_NAME,
-        )
-
-        self.feature_store_file_path = os.path.join(
-            self.data_ingestion_dir,
-            training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR,
-            training_pipeline.FILE_NAME
-        )
+    :return: Instance partagée de TrainingPipelineConfig.
+    """
+    return TrainingPipelineConfig()
 
-        self.training_file_path = os.path.join(
-            self.data_ingestion_dir,
-            training_pipeline.DATA_INGESTED_DIR_NAME,
-            training_pipeline.TRAIN_FILE_NAME
-        )
 
-        self.test_file_path = os.path.join(
-            self.data_ingestion_dir,
-            training_pipeline.DATA_INGESTED_DIR_NAME,
-            training_pipeline.TEST_FILE_NAME
-        )
+@dataclass(slots=True, frozen=True)
+class DataIngestionConfig:
+    """
+    Configuration du module d'ingestion des données.
 
-        self.train_test_split_ratio = training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
-        self.collection_name = training_pipeline.DATA_INGESTION_COLLECTION_NAME
-        self.database_name = training_pipeline.DATA_INGESTION_DATABASE_NAME
+    Cette classe définit les chemins des fichiers utilisés lors de la récupération
+    et du stockage des données pour l'entraînement et les tests.
 
+    :param training_pipeline_config: Instance de TrainingPipelineConfig.
+    """
 
+    training_pipeline_config: TrainingPipelineConfig
+    data_ingestion_dir: Path = field(init=False)
+    feature_store_file_path: Path = field(init=False)
+    training_file_path: Path = field(init=False)
+    test_file_path: Path = field(init=False)
+    train_test_split_ratio: float = field(init=False)
+    collection_name: str = field(init=False)
+    database_name: str = field(init=False)
+    mongo_batch_size: int = field(init=False)
+
+    def __post_init__(self):
+        data_ingestion_dir = self.training_pipeline_config.artifact_dir / training_pipeline.DATA_INGESTION_DIR_NAME
+        ingested_dir = data_ingestion_dir / training_pipeline.DATA_INGESTED_DIR_NAME
+
+        object.__setattr__(self, "data_ingestion_dir", data_ingestion_dir)
+        object.__setattr__(self, "feature_store_file_path",
+                           data_ingestion_dir / training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR
+                           / training_pipeline.FILE_NAME)
+        object.__setattr__(self, "training_file_path", ingested_dir / training_pipeline.TRAIN_FILE_NAME)
+        object.__setattr__(self, "test_file_path", ingested_dir / training_pipeline.TEST_FILE_NAME)
+        object.__setattr__(self, "train_test_split_ratio", training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO)
+        object.__setattr__(self, "collection_name", training_pipeline.DATA_INGESTION_COLLECTION_NAME)
+        object.__setattr__(self, "database_name", training_pipeline.DATA_INGESTION_DATABASE_NAME)
+        object.__setattr__(self, "mongo_batch_size", training_pipeline.DATA_INGESTION_MONGO_BATCH_SIZE)
+
+
+@dataclass(slots=True, frozen=True)
 class DataValidationConfig:
     """
     Classe de configuration pour la validation des données dans un pipeline d'entraînement.
@@ -73,54 +96,68 @@ class DataValidationConfig:
     `TrainingPipelineConfig` pour définir les répertoires liés à la validation des données.
 
     Attributs:
-        data_validation_dir (str): Répertoire principal pour la validation des données.
-        valid_data_dir (str): Répertoire contenant les données valides.
-        invalid_data_dir (str): Répertoire contenant les données invalides.
-        valid_train_file_path (str): Chemin du fichier d'entraînement valide.
-        valid_test_file_path (str): Chemin du fichier de test valide.
-        invalid_train_file_path (str): Chemin du fichier d'entraînement invalide.
-        invalid_test_file_path (str): Chemin du fichier de test invalide.
-        drift_report_file_path (str): Chemin du fichier de rapport de dérive des données.
+        training_pipeline_config (TrainingPipelineConfig): Configuration du pipeline d'entraînement.
+        data_validation_dir (Path): Répertoire principal pour la validation des données.
+        valid_data_dir (Path): Répertoire contenant les données valides.
+        invalid_data_dir (Path): Répertoire contenant les données invalides.
+        valid_train_file_path (Path): Chemin du fichier d'entraînement valide.
+        valid_test_file_path (Path): Chemin du fichier de test valide.
+        invalid_train_file_path (Path): Chemin du fichier d'entraînement invalide.
+        invalid_test_file_path (Path): Chemin du fichier de test invalide.
+        drift_report_file_path (Path): Chemin du fichier de rapport de dérive des données.
     """
 
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        """
-        Initialiser les chemins des répertoires et fichiers de validation des données.
-
-        Args:
-            training_pipeline_config (TrainingPipelineConfig): Une instance de `TrainingPipelineConfig`
-            qui fournit les chemins des répertoires et fichiers nécessaires pour l'entraînement.
-
-        """
-        self.data_validation_dir: str = os.path.join(
-            training_pipeline_config.artifact_dir,
-            training_pipeline.DATA_VALIDATION_DIR_NAME
-        )
-        self.valid_data_dir: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR)
-        self.invalid_data_dir: str = os.path.join(self.data_validation_dir,
-                                                  training_pipeline.DATA_VALIDATION_INVALID_DIR)
-        self.valid_train_file_path: str = os.path.join(self.valid_data_dir, training_pipeline.TRAIN_FILE_NAME)
-        self.valid_test_file_path: str = os.path.join(self.valid_data_dir, training_pipeline.TEST_FILE_NAME)
-        self.invalid_train_file_path: str = os.path.join(self.invalid_data_dir, training_pipeline.TRAIN_FILE_NAME)
-        self.invalid_test_file_path: str = os.path.join(self.invalid_data_dir, training_pipeline.TEST_FILE_NAME)
-        self.drift_report_file_path: str = os.path.join(
-            self.data_validation_dir,
-            training_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR,
-            training_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME,
-        )
-
-
+    training_pipeline_config: TrainingPipelineConfig
+    data_validation_dir: Path = field(init=False)
+    valid_data_dir: Path = field(init=False)
+    invalid_data_dir: Path = field(init=False)
+    valid_train_file_path: Path = field(init=False)
+    valid_test_file_path: Path = field(init=False)
+    invalid_train_file_path: Path = field(init=False)
+    invalid_test_file_path: Path = field(init=False)
+    drift_report_file_path: Path = field(init=False)
+
+    def __post_init__(self):
+        data_validation_dir = self.training_pipeline_config.artifact_dir / training_pipeline.DATA_VALIDATION_DIR_NAME
+        valid_data_dir = data_validation_dir / training_pipeline.DATA_VALIDATION_VALID_DIR
+        invalid_data_dir = data_validation_dir / training_pipeline.DATA_VALIDATION_INVALID_DIR
+
+        object.__setattr__(self, "data_validation_dir", data_validation_dir)
+        object.__setattr__(self, "valid_data_dir", valid_data_dir)
+        object.__setattr__(self, "invalid_data_dir", invalid_data_dir)
+        object.__setattr__(self, "valid_train_file_path", valid_data_dir / training_pipeline.TRAIN_FILE_NAME)
+        object.__setattr__(self, "valid_test_file_path", valid_data_dir / training_pipeline.TEST_FILE_NAME)
+        object.__setattr__(self, "invalid_train_file_path", invalid_data_dir / training_pipeline.TRAIN_FILE_NAME)
+        object.__setattr__(self, "invalid_test_file_path", invalid_data_dir / training_pipeline.TEST_FILE_NAME)
+        object.__setattr__(self, "drift_report_file_path",
+                           data_validation_dir / training_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR
+                           / training_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME)
+
+
+@dataclass(slots=True, frozen=True)
 class DataTransformationConfig:
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
-        self.data_transformation_dir: str = os.path.join(training_pipeline_config.artifact_dir,
-                                                         training_pipeline.DATA_TRANSFORMATION_DIR_NAME)
-        self.transformed_train_file_path: str = os.path.join(self.data_transformation_dir,
-                                                             training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-                                                             training_pipeline.TRAIN_FILE_NAME.replace("csv", "npy"), )
-        self.transformed_test_file_path: str = os.path.join(self.data_transformation_dir,
-                                                            training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-                                                            training_pipeline.TEST_FILE_NAME.replace("csv", "npy"), )
-        self.transformed_object_file_path: str = os.path.join(self.data_transformation_dir,
-                                                              training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,
-                                                              training_pipeline.PREPROCESSING_OBJECT_FILE_NAME, )
-        
\ No newline at end of file
+    training_pipeline_config: TrainingPipelineConfig
+    data_transformation_dir: Path = field(init=False)
+    transformed_train_file_path: Path = field(init=False)
+    transformed_test_file_path: Path = field(init=False)
+    transformed_train_target_file_path: Path = field(init=False)
+    transformed_test_target_file_path: Path = field(init=False)
+    transformed_object_file_path: Path = field(init=False)
+
+    def __post_init__(self):
+        data_transformation_dir = (self.training_pipeline_config.artifact_dir
+                                   / training_pipeline.DATA_TRANSFORMATION_DIR_NAME)
+        transformed_data_dir = data_transformation_dir / training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR
+
+        object.__setattr__(self, "data_transformation_dir", data_transformation_dir)
+        object.__setattr__(self, "transformed_train_file_path",
+                           transformed_data_dir / training_pipeline.TRAIN_FILE_NAME.replace("csv", "npy"))
+        object.__setattr__(self, "transformed_test_file_path",
+                           transformed_data_dir / training_pipeline.TEST_FILE_NAME.replace("csv", "npy"))
+        object.__setattr__(self, "transformed_train_target_file_path",
+                           transformed_data_dir / training_pipeline.DATA_TRANSFORMATION_TRAIN_TARGET_FILE_NAME)
+        object.__setattr__(self, "transformed_test_target_file_path",
+                           transformed_data_dir / training_pipeline.DATA_TRANSFORMATION_TEST_TARGET_FILE_NAME)
+        object.__setattr__(self, "transformed_object_file_path",
+                           data_transformation_dir / training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR
+                           / training_pipeline.PREPROCESSING_OBJECT_FILE_NAME)
@@ -2,37 +2,83 @@ import sys
 from network_security.logging import logger
 
 
+def _rebuild_exception(cls, error_message, filename, lineno):
+    """
+    Reconstruit une NetworkSecurityException désérialisée (pickle, copy) sans relire
+    `sys.exc_info()` : l'emplacement d'origine est restauré tel quel.
+    """
+    exc = cls.__new__(cls)
+    Exception.__init__(exc, error_message)
+    exc._error = error_message
+    exc._exc_tb = None
+    exc._location = (filename, lineno)
+    exc._message = None
+    return exc
+
 
 class NetworkSecurityException(Exception):
     """
     Exception personnalisée pour la gestion des erreurs liées à la sécurité réseau.
 
     Cette classe capture automatiquement le fichier et la ligne où l'exception a été levée,
-    facilitant ainsi le débogage.
+    facilitant ainsi le débogage. Le message détaillé n'est construit qu'au premier affichage.
     """
 
-    def __init__(self, error_message: Exception, error_detail: sys):
+    __slots__ = ("_error", "_exc_tb", "_location", "_message")
+
+    def __init__(self, error_message: Exception, error_detail: sys = None):
         """
         Initialise l'exception avec un message d'erreur et des détails supplémentaires.
 
         :param error_message: Message décrivant l'erreur.
-        :param error_detail: Objet sys contenant les détails de l'exception.
+        :param error_detail: (optionnel) Objet sys contenant les détails de l'exception ;
+            par défaut, l'exception en cours de traitement est utilisée.
         """
         super().__init__(error_message)  # Appelle le constructeur parent
 
-        # Récupération des détails de l'exception en cours
-        _, _, exc_tb = error_detail.exc_info()
+        # Seule la référence au traceback en cours est conservée ; il est lu à la demande
+        _, _, exc_tb = (error_detail or sys).exc_info()
+        self._error = error_message
+        self._exc_tb = exc_tb
+        self._location = None
+        self._message = None
+
+    def __reduce__(self):
+        """
+        Sérialise l'exception avec son fichier et sa ligne déjà résolus.
+
+        Les slots ne font pas partie de l'état sauvegardé par BaseException : sans cela,
+        la copie serait reconstruite par `cls(*args)` et relirait `sys.exc_info()`
+        là où elle est désérialisée (par ex. dans le processus parent de joblib).
+        """
+        return _rebuild_exception, (type(self), self._error, self.filename, self.lineno)
+
+    @property
+    def lineno(self):
+        """
+        Numéro de la ligne où l'erreur a été levée (None si aucun traceback).
+        """
+        if self._exc_tb is not None:
+            return self._exc_tb.tb_lineno
+        return self._location[1] if self._location is not None else None
 
-        # Vérification si l'erreur contient bien un traceback
-        if exc_tb is not None:
-            self.lineno = exc_tb.tb_lineno  # Numéro de la ligne où l'erreur a été levée
-            self.filename = exc_tb.tb_frame.f_code.co_filename  # Nom du fichier source
-        else:
-            self.lineno = None
-            self.filename = "Inconnu"
+    @property
+    def filename(self) -> str:
+        """
+        Nom du fichier source où l'erreur a été levée ("Inconnu" si aucun traceback).
+        """
+        if self._exc_tb is not None:
+            return self._exc_tb.tb_frame.f_code.co_filename
+        return self._location[0] if self._location is not None else "Inconnu"
 
-        # Construction du message d'erreur détaillé
-        self.error_message = f"{error_message} (Fichier: {self.filename}, Ligne: {self.lineno})"
+    @property
+    def error_message(self) -> str:
+        """
+        Message d'erreur détaillé, construit et mis en cache au premier accès.
+        """
+        if self._message is None:
+            self._message = f"{self._error} (Fichier: {self.filename}, Ligne: {self.lineno})"
+        return self._message
 
     def __str__(self):
         """
@@ -41,23 +87,3 @@ class NetworkSecurityException(Exception):
         :return: Message d'erreur détaillé.
         """
         return self.error_message
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
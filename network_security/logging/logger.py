@@ -1,22 +1,54 @@
 import logging
+import multiprocessing
 import os
 from datetime import datetime
 
-# Nom du fichier log avec un horodatage
-LOG_FILE = f"{datetime.now().strftime('%d%m%Y-%H%M%S')}.log"
+# Chemin du fichier log de l'exécution, fixé par configure_logging()
+LOG_FILE_PATH = None
 
-# Dossier où stocker les logs
-logs_dir = os.path.join(os.getcwd(), 'logs')
-os.makedirs(logs_dir, exist_ok=True)  # Création du dossier si inexistant
 
-# Chemin complet du fichier log
-LOG_FILE_PATH = os.path.join(logs_dir, LOG_FILE)
+def configure_logging(logs_dir: str = None) -> str:
+    """
+    Configure le logging du processus vers un fichier horodaté.
 
-# Configuration du logging
-logging.basicConfig(
-    filename=LOG_FILE_PATH,
-    level=logging.INFO,
-    format="%(asctime)s - Ligne %(lineno)d - %(name)s - %(levelname)s - %(message)s",
-)
+    À appeler depuis les points d'entrée (scripts, pipelines) : l'import du package
+    n'a ainsi plus d'effet de bord sur le système de fichiers. Dans les processus
+    enfants (workers joblib/loky, qui l'appellent au début de leur tâche), aucun
+    fichier n'est créé et le niveau est relevé à WARNING : les messages INFO sont
+    ignorés, les avertissements et erreurs restent visibles sur stderr. Les appels
+    suivants sont sans effet.
 
+    :param logs_dir: (optionnel) Dossier des logs, par défaut `logs/` dans le répertoire courant.
+    :return: Chemin du fichier log, ou None dans un processus enfant.
+    """
+    global LOG_FILE_PATH
 
+    if multiprocessing.current_process().name != "MainProcess":
+        logging.getLogger().setLevel(logging.WARNING)
+        return None
+
+    if LOG_FILE_PATH is not None:
+        return LOG_FILE_PATH
+
+    # Dossier où stocker les logs
+    logs_dir = logs_dir or os.path.join(os.getcwd(), 'logs')
+    os.makedirs(logs_dir, exist_ok=True)  # Création du dossier si inexistant
+
+    # Nom du fichier log avec un horodatage
+    log_file = f"{datetime.now().strftime('%d%m%Y-%H%M%S')}.log"
+    LOG_FILE_PATH = os.path.join(logs_dir, log_file)
+
+    # Le format n'utilise ni ligne, ni fichier, ni thread, ni processus : on évite à chaque
+    # enregistrement l'inspection de la pile et les appels threading/os correspondants.
+    # Réglages globaux au processus, donc réservés aux points d'entrée qui l'appellent.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging._srcfile = None
+
+    # Configuration du logging
+    logging.basicConfig(
+        filename=LOG_FILE_PATH,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    return LOG_FILE_PATH
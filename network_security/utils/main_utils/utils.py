@@ -1,14 +1,68 @@
-import yaml
 import os
 import sys
-import numpy as np
+import math
+import mmap
 import pickle
-from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import orjson
+import yaml
 
-from network_security.logging.logger import logging
+from network_security.logging.logger import logging, configure_logging
 from network_security.exceptions.exception import NetworkSecurityException
 
+# numpy et sklearn sont importés dans les fonctions qui s'en servent : lire un YAML
+# (ou démarrer un worker joblib) ne paie pas leur temps d'import
+if TYPE_CHECKING:
+    import numpy as np
+
+# Implémentations C de libyaml si PyYAML a été compilé avec, sinon repli pur Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Nombre de plis de validation croisée de la recherche sur grille
+_GRID_SEARCH_CV = 3
+
+# Dossiers déjà créés par ce processus : évite un os.makedirs à chaque sauvegarde
+_ensured_dirs = set()
+
+
+def _ensure_parent_dir(file_path: str) -> None:
+    """
+    Crée le dossier parent de `file_path` s'il n'a pas déjà été créé par ce processus.
+
+    Args:
+        file_path (str): Chemin du fichier à écrire.
+    """
+    dir_path = os.path.dirname(file_path)
+    if dir_path and dir_path not in _ensured_dirs:
+        os.makedirs(dir_path, exist_ok=True)
+        _ensured_dirs.add(dir_path)
+
+
+def _open_for_write(file_path: str, mode: str, **kwargs):
+    """
+    Ouvre `file_path` en écriture après avoir créé son dossier parent si nécessaire.
+
+    Si le dossier a été supprimé depuis sa création (artefacts nettoyés par un processus
+    de longue durée), il est retiré du cache puis recréé avant une seconde tentative.
+
+    Args:
+        file_path (str): Chemin du fichier à écrire.
+        mode (str): Mode d'ouverture ("w", "wb", ...).
+
+    Returns:
+        Objet fichier ouvert.
+    """
+    _ensure_parent_dir(file_path)
+    try:
+        return open(file_path, mode, **kwargs)
+    except FileNotFoundError:
+        _ensured_dirs.discard(os.path.dirname(file_path))
+        _ensure_parent_dir(file_path)
+        return open(file_path, mode, **kwargs)
+
 
 def read_yaml(file_path: str) -> dict:
     """
@@ -24,12 +78,28 @@ def read_yaml(file_path: str) -> dict:
         NetworkSecurityException: Si la lecture du fichier échoue.
     """
     try:
-        with open(file_path, "r") as yaml_file:
-            return yaml.safe_load(yaml_file)
+        with open(file_path, "r", encoding="utf-8") as yaml_file:
+            return yaml.load(yaml_file, Loader=_YAML_LOADER)
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
 
+@lru_cache(maxsize=1)
+def load_schema() -> dict:
+    """
+    Charge le schéma des données une seule fois par processus.
+
+    Le dictionnaire retourné est partagé par tous les appelants et ne doit pas être modifié.
+
+    Returns:
+        dict: Schéma des données lu depuis SCHEMA_FILE_PATH.
+    """
+    # Import local : les constantes du pipeline importent pandas et numpy
+    from network_security.constants.training_pipeline import SCHEMA_FILE_PATH
+
+    return read_yaml(SCHEMA_FILE_PATH)
+
+
 def write_yaml_file(file_path: str, content: object, replace: bool = False) -> None:
     """
     Écrit un dictionnaire dans un fichier YAML.
@@ -46,16 +116,36 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
         if replace and os.path.exists(file_path):
             os.remove(file_path)
 
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w") as file:
-            yaml.dump(content, file)
+        with _open_for_write(file_path, "w", encoding="utf-8") as file:
+            yaml.dump(content, file, Dumper=_YAML_DUMPER)
     except Exception as e:
         raise NetworkSecurityException(e, sys)
 
 
-def save_numpy_array_data(file_path: str, array: np.ndarray):
+def write_json_file(file_path: str, content: object) -> None:
     """
-    Sauvegarde un tableau NumPy dans un fichier.
+    Écrit un dictionnaire dans un fichier JSON indenté (sérialisation via orjson).
+
+    Args:
+        file_path (str): Chemin du fichier JSON.
+        content (object): Contenu à écrire dans le fichier.
+
+    Raises:
+        NetworkSecurityException: En cas d'erreur d'écriture.
+    """
+    try:
+        with _open_for_write(file_path, "wb") as file:
+            file.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def save_numpy_array_data(file_path: str, array: "np.ndarray"):
+    """
+    Sauvegarde un tableau NumPy dans un fichier .npy.
+
+    Le tableau est écrit C-contigu et sans pickle, ce qui permet de le recharger
+    par projection mémoire (voir `load_numpy_array_data`).
 
     Args:
         file_path (str): Chemin du fichier de sauvegarde.
@@ -64,20 +154,26 @@ def save_numpy_array_data(file_path: str, array: np.ndarray):
     Raises:
         NetworkSecurityException: En cas d'erreur de sauvegarde.
     """
+    import numpy as np
+
     try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as file_obj:
-            np.save(file_obj, array)
+        with _open_for_write(file_path, "wb") as file_obj:
+            np.save(file_obj, np.asarray(array, order="C"), allow_pickle=False)
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
 
-def load_numpy_array_data(file_path: str) -> np.ndarray:
+def load_numpy_array_data(file_path: str, mmap_mode: Optional[str] = "r") -> "np.ndarray":
     """
     Charge un tableau NumPy depuis un fichier.
 
+    Par défaut le fichier est projeté en mémoire en lecture seule : seules les pages
+    réellement lues sont chargées. Le tableau retourné n'est alors pas modifiable.
+
     Args:
         file_path (str): Chemin du fichier contenant les données.
+        mmap_mode (str, optionnel): Mode de projection mémoire ("r", "r+", "c").
+            None lit le tableau entièrement en mémoire (défaut : "r").
 
     Returns:
         np.ndarray: Tableau NumPy chargé.
@@ -85,12 +181,55 @@ def load_numpy_array_data(file_path: str) -> np.ndarray:
     Raises:
         NetworkSecurityException: En cas d'erreur de lecture.
     """
+    import numpy as np
+
+    try:
+        return np.load(file_path, mmap_mode=mmap_mode, allow_pickle=False)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys) from e
+
+
+def load_numpy_array_data_fast(file_path: str) -> "np.ndarray":
+    """
+    Charge un tableau NumPy en lisant l'en-tête .npy puis en projetant les données sans copie.
+
+    L'en-tête (magic, version, dtype, ordre, shape) est décodé directement et les données
+    sont exposées via `np.frombuffer` sur un `mmap` du fichier. Les cas non couverts
+    (ordre Fortran, dtype objet, version d'en-tête 3.0) passent par `load_numpy_array_data`.
+
+    Args:
+        file_path (str): Chemin du fichier .npy.
+
+    Returns:
+        np.ndarray: Tableau NumPy en lecture seule.
+
+    Raises:
+        NetworkSecurityException: En cas d'erreur de lecture.
+    """
+    import numpy as np
+
+    header_readers = {
+        (1, 0): np.lib.format.read_array_header_1_0,
+        (2, 0): np.lib.format.read_array_header_2_0,
+    }
     try:
         with open(file_path, "rb") as file_obj:
-            return np.load(file_obj, allow_pickle=True)
+            version = np.lib.format.read_magic(file_obj)
+            read_header = header_readers.get(version)
+            if read_header is not None:
+                shape, fortran_order, dtype = read_header(file_obj)
+                if not fortran_order and not dtype.hasobject:
+                    count = math.prod(shape)
+                    if count == 0:
+                        return np.empty(shape, dtype=dtype)
+                    offset = file_obj.tell()
+                    buffer = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+                    return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
+    return load_numpy_array_data(file_path)
+
 
 def save_object(file_path: str, obj: object) -> None:
     """
@@ -105,9 +244,9 @@ def save_object(file_path: str, obj: object) -> None:
     """
     try:
         logging.info("Sauvegarde de l'objet en cours...")
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as file_obj:
-            pickle.dump(obj, file_obj)
+        with _open_for_write(file_path, "wb") as file_obj:
+            # Protocole 5 : les buffers des tableaux numpy sont écrits sans copie intermédiaire
+            pickle.dump(obj, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
         logging.info("Objet sauvegardé avec succès.")
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
@@ -129,23 +268,68 @@ def load_object(file_path: str) -> object:
     try:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Le fichier {file_path} n'existe pas.")
+        # Lecture en un seul appel puis désérialisation en mémoire (évite un read() par opcode)
         with open(file_path, "rb") as file_obj:
-            return pickle.load(file_obj)
+            data = file_obj.read()
+        return pickle.loads(data, fix_imports=False)
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
 
-def evaluate_models(X_train, y_train, X_test, y_test, models: dict, param: dict) -> dict:
+def _fit_and_score(model, param_grid, X_train, y_train, X_test, y_test, n_jobs: int):
+    """
+    Entraîne un modèle (avec GridSearchCV si une grille est fournie) et le score.
+
+    Exécutée soit dans le processus principal, soit dans un worker joblib : elle ne
+    journalise rien et retourne l'estimateur entraîné pour que l'appelant le récupère.
+
+    Returns:
+        tuple: (modèle entraîné, R² entraînement, R² test).
+    """
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import GridSearchCV
+
+    if param_grid is None:
+        model.fit(X_train, y_train)
+    else:
+        # GridSearchCV réentraîne déjà le meilleur candidat sur tout le jeu d'entraînement
+        gs = GridSearchCV(model, param_grid, cv=_GRID_SEARCH_CV, n_jobs=n_jobs, pre_dispatch="2*n_jobs")
+        gs.fit(X_train, y_train)
+        model = gs.best_estimator_
+
+    train_score = r2_score(y_train, model.predict(X_train))
+    test_score = r2_score(y_test, model.predict(X_test))
+    return model, train_score, test_score
+
+
+def _fit_and_score_in_worker(*args):
+    """
+    Point d'entrée de `_fit_and_score` dans un worker joblib : le logging du worker est
+    configuré (niveau WARNING, sans fichier) avant l'entraînement.
+    """
+    configure_logging()
+    return _fit_and_score(*args)
+
+
+def evaluate_models(X_train, y_train, X_test, y_test, models: dict, param: dict, n_jobs: int = -1) -> dict:
     """
     Évalue plusieurs modèles en optimisant leurs hyperparamètres avec GridSearchCV.
 
+    Le parallélisme est placé à un seul niveau, celui qui occupe le plus de cœurs :
+    les modèles sont entraînés en parallèle (une grille séquentielle par worker)
+    uniquement si min(nombre de modèles, cœurs) dépasse min(ajustements moyens par
+    modèle, cœurs), où un ajustement est un candidat de la grille × un pli ; sinon,
+    les modèles sont traités l'un après l'autre et chaque grille est parallélisée.
+
     Args:
         X_train (np.ndarray): Données d'entraînement.
         y_train (np.ndarray): Cibles d'entraînement.
         X_test (np.ndarray): Données de test.
         y_test (np.ndarray): Cibles de test.
-        models (dict): Dictionnaire contenant les modèles à entraîner.
+        models (dict): Dictionnaire contenant les modèles à entraîner. Chaque entrée est remplacée
+            par le modèle entraîné avec les meilleurs hyperparamètres.
         param (dict): Dictionnaire des hyperparamètres associés aux modèles.
+        n_jobs (int, optionnel): Nombre de processus utilisables (défaut : -1, tous les cœurs).
 
     Returns:
         dict: Scores R² des modèles sur les données de test.
@@ -153,28 +337,42 @@ def evaluate_models(X_train, y_train, X_test, y_test, models: dict, param: dict)
     Raises:
         NetworkSecurityException: En cas d'erreur lors de l'entraînement ou de l'évaluation.
     """
-    try:
-        report = {}
+    from joblib import Parallel, delayed, effective_n_jobs
+    from sklearn.model_selection import ParameterGrid
 
-        for model_name, model in models.items():
+    try:
+        grids = {}
+        for model_name in models:
             if model_name not in param:
                 logging.warning(f"Aucun paramètre d'optimisation trouvé pour {model_name}. Utilisation des paramètres par défaut.")
-                gs = None
+                grids[model_name] = None
             else:
-                gs = GridSearchCV(model, param[model_name], cv=3)
-                gs.fit(X_train, y_train)
-                model.set_params(**gs.best_params_)
-
-            model.fit(X_train, y_train)
-
-            y_train_pred = model.predict(X_train)
-            y_test_pred = model.predict(X_test)
-
-            train_score = r2_score(y_train, y_train_pred)
-            test_score = r2_score(y_test, y_test_pred)
+                grids[model_name] = param[model_name]
+
+        n_cores = effective_n_jobs(n_jobs)
+        mean_fits_per_model = sum(
+            len(ParameterGrid(grid)) * _GRID_SEARCH_CV if grid is not None else 1 for grid in grids.values()
+        ) / max(len(models), 1)
+        # Nombre de tâches simultanées de chaque stratégie, bornées par les cœurs disponibles
+        parallel_models = min(len(models), n_cores) > min(mean_fits_per_model, n_cores)
+
+        if parallel_models:
+            n_workers = min(n_cores, len(models))
+            logging.info(f"Entraînement de {len(models)} modèles en parallèle sur {n_workers} cœurs.")
+            results = Parallel(n_jobs=n_workers, backend="loky")(
+                delayed(_fit_and_score_in_worker)(model, grids[model_name], X_train, y_train, X_test, y_test, 1)
+                for model_name, model in models.items()
+            )
+        else:
+            results = [
+                _fit_and_score(model, grids[model_name], X_train, y_train, X_test, y_test, n_jobs)
+                for model_name, model in models.items()
+            ]
 
+        report = {}
+        for model_name, (model, train_score, test_score) in zip(list(models), results):
+            models[model_name] = model
             logging.info(f"Modèle {model_name} - R² entraînement : {train_score:.4f}, R² test : {test_score:.4f}")
-
             report[model_name] = test_score
 
         return report
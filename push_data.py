@@ -1,15 +1,17 @@
 
-from pymongo.mongo_client import MongoClient
-from pymongo.server_api import ServerApi
 import os
 import sys
-import json
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
 from dotenv import load_dotenv
 import certifi
-import pandas as pd
 from network_security.logging import logger
 from network_security.exceptions.exception import NetworkSecurityException
 
+# pymongo, pyarrow et pandas sont importés dans les méthodes qui s'en servent
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Certificat SSL pour MongoDB Atlas
 ca = certifi.where()
 
@@ -17,74 +19,169 @@ ca = certifi.where()
 load_dotenv()
 MONGO_URI = os.getenv("MONGO_DB_URL")
 
+# Nombre de documents envoyés par appel à insert_many
+INSERT_BATCH_SIZE = 10_000
+# Nombre d'enregistrements insérés à la fois par push_csv
+CSV_CHUNK_SIZE = 50_000
+# Taille des blocs découpés par le lecteur CSV pyarrow (un bloc par thread)
+CSV_BLOCK_SIZE = 16 << 20
+
 
 class DataExtractionAndPusher:
     """
     Classe pour extraire des données CSV et les insérer dans MongoDB.
     """
 
-    def __init__(self, database: str, collection: str, mongo_uri: str = MONGO_URI):
+    def __init__(self, database: str, collection: str, mongo_uri: str = MONGO_URI,
+                 unacknowledged_writes: bool = False):
         """
         Initialise la connexion à MongoDB et sélectionne la base de données et la collection.
 
+        Le client est conservé entre les insertions (pool de connexions) ; il est fermé
+        par `close()` ou en sortie de bloc `with`.
+
         :param database: Nom de la base de données MongoDB.
         :param collection: Nom de la collection MongoDB.
         :param mongo_uri: URI de connexion MongoDB (par défaut, récupéré depuis les variables d'environnement).
+        :param unacknowledged_writes: Si True, insère avec le write concern w=0 (sans accusé de réception) :
+            débit maximal, mais les erreurs d'insertion ne sont pas remontées.
         """
         self.database_name = database
         self.collection_name = collection
         self.mongo_uri = mongo_uri
 
         try:
-            self.mongo_client = MongoClient(self.mongo_uri, server_api=ServerApi("1"), tlsCAFile=ca)
+            from pymongo.mongo_client import MongoClient
+            from pymongo.server_api import ServerApi
+            from pymongo.write_concern import WriteConcern
+            from network_security.constants.training_pipeline import DATA_INGESTION_MONGO_COMPRESSORS
+
+            self.mongo_client = MongoClient(self.mongo_uri, server_api=ServerApi("1"), tlsCAFile=ca,
+                                            compressors=DATA_INGESTION_MONGO_COMPRESSORS)
             self.database = self.mongo_client[self.database_name]
             self.collection = self.database[self.collection_name]
+
+            # MongoDB refuse bypass_document_validation avec un write concern non acquitté
+            if unacknowledged_writes:
+                self._insert_collection = self.collection.with_options(write_concern=WriteConcern(w=0))
+                self._insert_options = {"ordered": False}
+            else:
+                self._insert_collection = self.collection
+                self._insert_options = {"ordered": False, "bypass_document_validation": True}
             logger.logging.info(f"Connexion établie avec MongoDB: {self.database_name}.{self.collection_name}")
         except Exception as e:
             raise NetworkSecurityException(e, sys)
-    @staticmethod
-    def csv_to_json_converter( filepath: str) -> list:
+
+    def push_csv(self, filepath: str, chunksize: int = CSV_CHUNK_SIZE) -> int:
         """
-        Convertit un fichier CSV en liste de dictionnaires JSON.
+        Lit un fichier CSV avec le lecteur multithread de pyarrow et l'insère par lots dans MongoDB.
+
+        Le fichier est chargé en colonnes Arrow (compactes), puis converti en dictionnaires
+        lot par lot, sans passer par un DataFrame pandas.
 
-        :param filepath: Chemin du fichier CSV à convertir.
-        :return: Liste des enregistrements convertis.
+        :param filepath: Chemin du fichier CSV à insérer.
+        :param chunksize: Nombre d'enregistrements insérés à chaque appel à insert_many.
+        :return: Nombre total d'enregistrements insérés.
         """
         try:
-            logger.logging.info(f"Conversion du fichier CSV en JSON: {filepath}")
-            dataframe = pd.read_csv(filepath)
-            dataframe.reset_index(inplace=True, drop=True)
-            record = json.loads(dataframe.to_json(orient="records"))
-            logger.logging.info(f"Conversion réussie. Nombre d'enregistrements: {len(record)}")
-            return record
+            from pyarrow import csv as pacsv
+
+            logger.logging.info(f"Insertion du fichier CSV dans MongoDB: {filepath}")
+            table = pacsv.read_csv(
+                filepath,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            )
+            records = (record for batch in table.to_batches(max_chunksize=chunksize)
+                       for record in batch.to_pylist())
+            return self.insert_records(records, batch_size=chunksize)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
-    def insert_dataframe(self, dataframe: pd.DataFrame):
+    def insert_records(self, records: Iterable[dict], batch_size: int = INSERT_BATCH_SIZE) -> int:
         """
-        Insère un DataFrame Pandas dans la collection MongoDB.
+        Insère des enregistrements (dictionnaires) dans la collection MongoDB par lots.
 
-        :param dataframe: DataFrame contenant les données à insérer.
+        Les lots sont envoyés en mode non ordonné : le serveur peut les traiter en parallèle
+        et poursuit l'insertion en cas de doublon. `records` peut être un générateur : seul
+        un lot est matérialisé à la fois.
+
+        :param records: Enregistrements à insérer.
+        :param batch_size: Nombre de documents par appel à insert_many.
+        :return: Nombre total d'enregistrements insérés.
         """
         try:
-            logger.logging.info(f"Insertion de {len(dataframe)} enregistrements dans MongoDB...")
-            record = dataframe.to_dict(orient="records")
-            self.collection.insert_many(record)
-            logger.logging.info("Insertion réussie dans MongoDB.")
+            records = iter(records)
+            inserted = 0
+            while batch := list(islice(records, batch_size)):
+                self._insert_batch(batch)
+                inserted += len(batch)
+            logger.logging.info(f"Insertion réussie dans MongoDB. Nombre d'enregistrements: {inserted}")
+            return inserted
         except Exception as e:
-            raise NetworkSecurityException(e,sys)
-        finally:
-            self.mongo_client.close()  # Fermeture de la connexion MongoDB
+            raise NetworkSecurityException(e, sys)
+
+    def insert_dataframe(self, dataframe: "pd.DataFrame", batch_size: int = INSERT_BATCH_SIZE) -> int:
+        """
+        Insère un DataFrame Pandas dans la collection MongoDB par lots (voir `insert_records`).
+
+        :param dataframe: DataFrame contenant les données à insérer.
+        :param batch_size: Nombre de documents par appel à insert_many.
+        :return: Nombre total d'enregistrements insérés.
+        """
+        logger.logging.info(f"Insertion de {len(dataframe)} enregistrements dans MongoDB...")
+        return self.insert_records(self._dataframe_records(dataframe, batch_size), batch_size=batch_size)
+
+    @staticmethod
+    def _dataframe_records(dataframe: "pd.DataFrame", batch_size: int) -> Iterator[dict]:
+        """
+        Convertit un DataFrame en dictionnaires, un morceau de `batch_size` lignes à la fois.
+
+        Les NaN sont remplacés par None pour être stockés comme null dans MongoDB.
+
+        :param dataframe: DataFrame à convertir.
+        :param batch_size: Nombre de lignes converties à la fois.
+        :return: Générateur d'enregistrements.
+        """
+        for start in range(0, len(dataframe), batch_size):
+            chunk = dataframe.iloc[start:start + batch_size]
+            if chunk.isna().values.any():
+                chunk = chunk.astype(object).where(chunk.notna(), None)
+            yield from chunk.to_dict(orient="records")
+
+    def _insert_batch(self, batch: list):
+        """
+        Envoie un lot de documents en une seule écriture non ordonnée.
+
+        Chaque document est encodé en BSON d'un seul passage par l'extension C de bson et
+        envoyé tel quel (RawBSONDocument) : pymongo ne reparcourt pas les dictionnaires et
+        ne leur ajoute pas de `_id`, généré par le serveur.
+
+        :param batch: Liste de documents à insérer.
+        """
+        from bson import encode
+        from bson.raw_bson import RawBSONDocument
+
+        documents = [RawBSONDocument(encode(document)) for document in batch]
+        self._insert_collection.insert_many(documents, **self._insert_options)
+
+    def close(self):
+        """
+        Ferme la connexion MongoDB.
+        """
+        self.mongo_client.close()
 
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 if __name__ == "__main__":
+    logger.configure_logging()
     try:
-        data_pusher = DataExtractionAndPusher(database="mlops", collection="NetworkData", mongo_uri=MONGO_URI)
-        records = data_pusher.csv_to_json_converter("Network_Data/phisingData.csv")
-        df = pd.DataFrame(records)
-        data_pusher.insert_dataframe(df)
+        with DataExtractionAndPusher(database="mlops", collection="NetworkData", mongo_uri=MONGO_URI) as data_pusher:
+            data_pusher.push_csv("Network_Data/phisingData.csv")
     except NetworkSecurityException as nse:
         logger.logging.info(nse)
 
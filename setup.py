@@ -12,11 +12,14 @@ def get_requirements(filename: str = "requirements.txt") -> List[str]:
     Lit le fichier des dépendances et retourne une liste des packages requis.
 
     :param filename: Nom du fichier contenant les dépendances.
-    :return: Liste des dépendances filtrées.
+    :return: Liste des dépendances filtrées (sans lignes vides, commentaires ni `-e .`).
     """
+    # Lignes ignorées : lignes vides et installation éditable du projet lui-même
+    skip = {"", "-e ."}
     try:
         with open(filename, "r", encoding="utf-8") as f:
-            return [line.strip() for line in f.readlines() if line.strip() and line.strip() != "-e ."]
+            return [req for req in (line.strip() for line in f)
+                    if req not in skip and not req.startswith("#")]
     except FileNotFoundError:
         print(f"⚠️ Fichier {filename} introuvable. Aucune dépendance installée.")
         return []
@@ -35,5 +38,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",  # Version minimale requise de Python
+    python_requires=">=3.10",  # Version minimale requise de Python
 )